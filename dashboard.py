@@ -0,0 +1,325 @@
+import streamlit as st
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go  # WebGL traces (Scattergl) need plotly.js >= 2.x, bundled with plotly >= 5
+from wordcloud import WordCloud
+from concurrent.futures import ThreadPoolExecutor
+
+# Maximum number of points drawn in the scatter plots
+SCATTER_SAMPLE_SIZE = 5000
+
+# ======== Helpers ========
+def scatter_with_trendline(df, df_vis, x_col, y_col, title):
+    """
+    Scatter plot of sampled points with an OLS line fitted on the raw sample
+    Args:
+        df (DataFrame): random sample of raw rows, used for the trendline
+        df_vis (DataFrame): sampled rows drawn as points
+        x_col (str): column on the x axis
+        y_col (str): column on the y axis
+        title (str): figure title
+    """
+    data = df[[x_col, y_col]].dropna()
+    x, y = data[x_col].to_numpy(dtype=float), data[y_col].to_numpy(dtype=float)
+
+    # Fit the trendline once on the whole raw sample
+    slope, intercept = np.polyfit(x, y, 1)
+
+    fig = px.scatter(df_vis, x=x_col, y=y_col, title=title, render_mode='webgl')
+    xmin, xmax = x.min(), x.max()
+    fig.add_scatter(x=[xmin, xmax], y=[slope * xmin + intercept, slope * xmax + intercept],
+                    mode='lines', name='OLS trendline')
+    return fig
+
+
+@st.cache_data
+def precompute(_df, n_rows, last_date):
+    """
+    Run the aggregations that need the raw rows once per dataset
+    Args:
+        _df (DataFrame): loaded data (not hashed by Streamlit)
+        n_rows (int): number of rows, used as part of the cache key
+        last_date: latest date in the data, used as part of the cache key
+    """
+    aggregates = {}
+    # Past a few thousand points the scatter plots look the same, so draw a sample
+    if len(_df) > SCATTER_SAMPLE_SIZE:
+        aggregates['scatter_sample'] = _df.sample(n=SCATTER_SAMPLE_SIZE, random_state=0)
+    else:
+        aggregates['scatter_sample'] = _df
+    if 'Month' in _df.columns and 'Temperature(°C)' in _df.columns:
+        # Quartiles, whiskers and outliers for the monthly box plot (1.5 IQR rule, like plotly)
+        dated = _df[_df['Month'].notna()]
+        temp = dated["Temperature(°C)"]
+        stats = dated.groupby('Month')["Temperature(°C)"].describe(percentiles=[.25, .5, .75])
+        q1, q3 = dated['Month'].map(stats['25%']), dated['Month'].map(stats['75%'])
+        iqr = q3 - q1
+        inside = (temp >= q1 - 1.5 * iqr) & (temp <= q3 + 1.5 * iqr)
+        stats['lowerfence'] = temp.where(inside).groupby(dated['Month']).min()
+        stats['upperfence'] = temp.where(inside).groupby(dated['Month']).max()
+        aggregates['monthly_temp_box'] = {
+            'stats': stats,
+            'outliers': dated.loc[~inside & temp.notna(), ['Month', "Temperature(°C)"]],
+        }
+    return aggregates
+
+
+# Called from the figure worker threads, which can't show a spinner
+@st.cache_resource(show_spinner=False)
+def make_wordcloud(freqs):
+    """Build the weather word cloud once from the weather condition counts"""
+    return WordCloud(width=800, height=400, background_color='white').generate_from_frequencies(freqs)
+
+# ======== Figure Builders ========
+# Each builder only uses df and the precomputed aggregates (no st.* calls),
+# so they can run in worker threads. Counts and extremes come from load_aggregates_fn.
+def build_weather_pie(df, aggregates):
+    weather_counts = aggregates['weather_top5']
+    # seaborn's "pastel" palette
+    colors = ['#a1c9f4', '#ffb482', '#8de5a1', '#ff9f9b', '#d0bbff',
+              '#debb9b', '#fab0e4', '#cfcfcf', '#fffea3', '#b9f2f0']
+
+    return px.pie(
+        names=weather_counts.index,
+        values=weather_counts.values,
+        title="Proportion of Weather Conditions",
+        color_discrete_sequence=colors
+    )
+
+
+def build_correlation_heatmap(df, aggregates):
+    return px.imshow(aggregates['corr_matrix'], text_auto='.2f', color_continuous_scale='RdBu_r',
+                     zmin=-1, zmax=1, aspect='auto')
+
+
+def build_weather_bar(df, aggregates):
+    weather_counts = aggregates['weather_top10']
+    return px.bar(weather_counts,
+                  orientation='h',
+                  color=weather_counts.index,
+                  color_discrete_sequence=px.colors.qualitative.Pastel,
+                  labels={'value': 'Count', 'index': 'Weather Condition'})
+
+
+def build_monthly_temp_line(df, aggregates):
+    monthly_temp = aggregates['monthly_temp']
+
+    fig = go.Figure([
+        go.Scattergl(x=monthly_temp['Month'], y=monthly_temp[metric], mode='lines+markers',
+                     name=metric, line=dict(color=color))
+        for metric, color in [('min', 'skyblue'), ('max', 'salmon')]
+    ])
+    fig.update_layout(xaxis_title='Month', yaxis_title='Temperature (°C)', legend_title='Metric')
+    return fig
+
+
+def build_temp_histogram(df, aggregates):
+    # Bin on the server so only the bar heights are sent to the browser
+    counts, edges = np.histogram(df['Temperature(°C)'].dropna().to_numpy(), bins=20)
+    centers = (edges[:-1] + edges[1:]) / 2
+    fig = go.Figure(go.Bar(x=centers, y=counts, width=np.diff(edges), marker_color='skyblue',
+                           customdata=np.column_stack([edges[:-1], edges[1:]]),
+                           hovertemplate='%{customdata[0]:.1f} - %{customdata[1]:.1f}: %{y}<extra></extra>'))
+    fig.update_layout(title=f'Histogram (random sample of {len(df)} rows)', xaxis_title='Temperature(°C)',
+                      yaxis_title='count',
+                      bargap=0)
+    return fig
+
+
+def build_monthly_temp_box(df, aggregates):
+    # Boxes are drawn from precomputed statistics, only outliers are sent as points
+    stats = aggregates['monthly_temp_box']['stats']
+    outliers = aggregates['monthly_temp_box']['outliers']
+
+    fig = go.Figure(go.Box(x=stats.index,
+                           q1=stats['25%'],
+                           median=stats['50%'],
+                           q3=stats['75%'],
+                           lowerfence=stats['lowerfence'],
+                           upperfence=stats['upperfence'],
+                           marker_color='#40E0D0',
+                           name='Temperature(°C)'))
+    fig.add_trace(go.Scatter(x=outliers['Month'], y=outliers['Temperature(°C)'],
+                             mode='markers', marker_color='#40E0D0', name='Outliers'))
+    # Quartiles need the raw rows, so unlike the min/max line this uses the sample
+    fig.update_layout(title=f'Monthly Temperature Variability (random sample of {len(df)} rows)',
+                      xaxis_title='Month',
+                      yaxis_title='Temperature(°C)',
+                      template='plotly_white',
+                      showlegend=False)
+    return fig
+
+
+def build_scatter_temp_humidity(df, aggregates):
+    return scatter_with_trendline(
+        df,
+        aggregates['scatter_sample'],
+        x_col='Humidity (%)',
+        y_col='Temperature(°C)',
+        title='Relationship between Temperature and Humidity'
+    )
+
+
+def build_scatter_temp_barometer(df, aggregates):
+    return scatter_with_trendline(
+        df,
+        aggregates['scatter_sample'],
+        x_col='Barometer (inHg)',
+        y_col='Temperature(°C)',
+        title='Relationship between Temperature and Barometer'
+    )
+
+
+def build_wind_stacked_bar(df, aggregates):
+    wind_counts = aggregates['wind_pivot']
+
+    # Create plot
+    colors = px.colors.sample_colorscale('RdBu', list(np.linspace(0, 1, len(wind_counts.columns))))
+    fig = go.Figure([
+        go.Bar(x=wind_counts.index, y=wind_counts[col], name=str(col), marker_color=color)
+        for col, color in zip(wind_counts.columns, colors)
+    ])
+
+    # Customize plot
+    fig.update_layout(barmode='stack',
+                      title='Monthly Wind Conditions (Stacked)',
+                      xaxis_title='Month',
+                      yaxis_title='Frequency',
+                      legend_title='Wind Type')
+    return fig
+
+
+def build_weather_wordcloud(df, aggregates):
+    wordcloud = make_wordcloud(aggregates['weather_freqs'])
+    fig = px.imshow(wordcloud.to_array(), binary_string=True)
+    fig.update_xaxes(visible=False)
+    fig.update_yaxes(visible=False)
+    return fig
+
+
+# name -> (builder, df columns or aggregates the figure needs)
+FIGURE_BUILDERS = {
+    'weather_pie': (build_weather_pie, ['weather_top5']),
+    'correlation_heatmap': (build_correlation_heatmap, ['corr_matrix']),
+    'weather_bar': (build_weather_bar, ['weather_top10']),
+    'monthly_temp_line': (build_monthly_temp_line, ['monthly_temp']),
+    'temp_histogram': (build_temp_histogram, ['Temperature(°C)']),
+    'monthly_temp_box': (build_monthly_temp_box, ['monthly_temp_box']),
+    'scatter_temp_humidity': (build_scatter_temp_humidity, ['Temperature(°C)', 'Humidity (%)']),
+    'scatter_temp_barometer': (build_scatter_temp_barometer, ['Temperature(°C)', 'Barometer (inHg)']),
+    'wind_stacked_bar': (build_wind_stacked_bar, ['wind_pivot']),
+    'weather_wordcloud': (build_weather_wordcloud, ['weather_freqs']),
+}
+
+
+# Called from the figure worker threads, which can't show a spinner.
+# cache_resource keeps the Figure object itself, so reruns skip both the
+# builder and a pickle round-trip of the figure.
+@st.cache_resource(show_spinner=False)
+def cached_figure(name, _df, _aggregates, n_rows, last_date):
+    """
+    Build a figure once per dataset and reuse it on reruns
+    Args:
+        name (str): key in FIGURE_BUILDERS
+        _df (DataFrame): loaded data (not hashed by Streamlit)
+        _aggregates (dict): output of precompute (not hashed by Streamlit)
+        n_rows (int): number of rows, used as part of the cache key
+        last_date: latest date in the data, used as part of the cache key
+    """
+    builder, _ = FIGURE_BUILDERS[name]
+    return builder(_df, _aggregates)
+
+
+def run(load_data_fn, load_aggregates_fn):
+    """
+    Render the whole dashboard
+    Args:
+        load_data_fn (callable): returns the raw rows as a DataFrame (with 'Month' derived from 'Date')
+        load_aggregates_fn (callable): returns the weather counts, monthly extremes, wind counts and correlations
+    """
+    # ============ Initialize the page ===========
+    st.set_page_config(layout="wide", page_title="Alexandria Weather Dashboard", page_icon="🌤️")
+
+    # ======== Header Section ========
+    st.title("🌤️ Alexandria Weather Dashboard")
+    st.markdown("""
+        <div style="text-align: right;">
+        <h3>Historical Weather Data Analysis</h3>
+        <p>Interactive visualization of weather patterns</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Load the raw rows and the aggregates separately, so either one can fail on its own
+    df = load_data_fn()
+    aggregates = load_aggregates_fn()
+
+    # ======== Data Visualizations ========
+    if df.empty and not aggregates:
+        st.warning("⚠️ No data available for visualization.")
+        return
+
+    data_key = (len(df), df['Date'].max() if 'Date' in df.columns else None)
+    if not df.empty:
+        aggregates = {**aggregates, **precompute(df, *data_key)}
+
+    # Build all available figures in parallel, then display them in order
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        figures = {
+            name: executor.submit(cached_figure, name, df, aggregates, *data_key)
+            for name, (_, needs) in FIGURE_BUILDERS.items()
+            if all(key in df.columns or key in aggregates for key in needs)
+        }
+
+    def show(name):
+        if name in figures:
+            st.plotly_chart(figures[name].result(), use_container_width=True)
+
+    # 1. Weather Distribution Pie Chart
+    st.markdown("---")
+    st.header("☁️ Weather Conditions Distribution")
+    show('weather_pie')
+
+    # 2. Correlation Heatmap
+    st.markdown("---")
+    st.title("🔍 Features Correlation")
+    st.header("Heatmap to visualize the correlation between the numerical features")
+    show('correlation_heatmap')
+
+    # 3. Weather Frequency Bar Chart
+    st.markdown("---")
+    st.title("📊 Most Frequent Weather Conditions")
+    st.header("Bar Chart to display the frequency of Weather Conditions")
+    show('weather_bar')
+
+    # 4. Monthly Temperature Extremes
+    #Line plot
+    st.markdown("---")
+    st.title("🌡️ Monthly Temperature Extremes")
+    st.header("Line plot for comparing the min & max temperature for each month")
+    show('monthly_temp_line')
+
+    # 5. Temperature Distribution Histogram
+    st.markdown("---")
+    st.header("📈 Temperature Distribution")
+    show('temp_histogram')
+
+    # 6.Comparing the temperature distribution for each month using boxplots
+    show('monthly_temp_box')
+
+    # 7. Scatter Plot: Temperature vs Humidity
+    st.markdown("---")
+    st.header("💧 Temperature vs Humidity")
+    show('scatter_temp_humidity')
+
+    # 8. Scatter Plot: Temperature vs Barometer
+    show('scatter_temp_barometer')
+
+    # 9.  Stacked barchart to get top 10 most frequent wind types in data with respect to each month
+    if 'wind_stacked_bar' in figures:
+        st.header("Stacked Barchart to get top 10 most frequent wind types in data with respect to each month")
+        show('wind_stacked_bar')
+
+    # 10. Word Cloud for Weather Conditions
+    st.markdown("---")
+    st.header("☁️ Weather Word Cloud")
+    show('weather_wordcloud')
@@ -1,35 +1,50 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import os
+import glob
 from pymongo import MongoClient
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-from wordcloud import WordCloud
-
-# ============ Initialize the page ===========
-st.set_page_config(layout="wide", page_title="Alexandria Weather Dashboard", page_icon="🌤️")
-
-# ======== Header Section ========
-st.title("🌤️ Alexandria Weather Dashboard")
-st.markdown("""
-    <div style="text-align: right;">
-    <h3>Historical Weather Data Analysis</h3>
-    <p>Interactive visualization of weather patterns</p>
-    </div>
-    """, unsafe_allow_html=True)
+from dashboard import run
 
 # ======== Data Loading ========
+CACHE_DIR = ".cache"
+# Number of raw rows sampled from MongoDB for the panels that need them
+RAW_SAMPLE_SIZE = 10000
+# Only the fields used by the visualizations are fetched from MongoDB
+FIELDS = ["Date", "Weather", "Temperature(°C)", "Humidity (%)", "Barometer (inHg)", "Wind (mph)"]
+# Numerical features shown in the correlation heatmap
+CORR_FEATURES = ["Temperature(°C)", "Humidity (%)", "Barometer (inHg)"]
+
+@st.cache_resource
+def get_client():
+    """One MongoClient for the whole process (it pools connections itself)"""
+    return MongoClient(st.secrets["MONGO_URI"], maxPoolSize=10, serverSelectionTimeoutMS=3000)
+
+def get_collection():
+    # Connect to MongoDB Atlas using secrets from Streamlit
+    client = get_client()
+    db = client[st.secrets["DB_NAME"]]
+    return db[st.secrets["COLLECTION_NAME"]]
+
 @st.cache_data
-def load_data():
+def load_raw_sample():
+      """Load a random sample of raw rows for the histogram, box and scatter panels"""
       try:
-        # Connect to MongoDB Atlas using secrets from Streamlit
-        client = MongoClient(st.secrets["MONGO_URI"])
-        db = client[st.secrets["DB_NAME"]]
-        collection = db[st.secrets["COLLECTION_NAME"]]
-
-        # Load data from MongoDB
-        data = list(collection.find())
-        df = pd.DataFrame(data)
+        collection = get_collection()
+
+        # Reuse the cleaned sample saved on disk if the collection hasn't changed
+        latest = collection.estimated_document_count()
+        last_doc = collection.find_one(sort=[("_id", -1)], projection={"_id": 1})
+        max_id = last_doc["_id"] if last_doc else "empty"
+        cache_path = os.path.join(CACHE_DIR, f"cache_{max_id}_{latest}_{RAW_SAMPLE_SIZE}.parquet")
+        if os.path.exists(cache_path):
+            return pd.read_parquet(cache_path, engine="pyarrow")
+
+        # Let MongoDB pick the sample and stream only the needed fields into the DataFrame
+        projection = {"_id": 0, **{field: 1 for field in FIELDS}}
+        cursor = collection.aggregate([{"$sample": {"size": RAW_SAMPLE_SIZE}}, {"$project": projection}],
+                                      batchSize=5000)
+        df = pd.DataFrame.from_records(cursor)
 
         # Clean DataFrame
         if "_id" in df.columns:
@@ -37,163 +52,141 @@ def load_data():
 
         # Handle date columns
         if 'Date' in df.columns:
-            df['Date'] = pd.to_datetime(df['Date'])
-            df['Month'] = df['Date'].dt.month
+            # BSON dates already arrive as datetimes, only parse ISO strings
+            if pd.api.types.is_datetime64_any_dtype(df['Date']):
+                df['Date'] = df['Date'].astype('datetime64[ns]')
+            else:
+                df['Date'] = pd.to_datetime(df['Date'], format='ISO8601', cache=True)
+            # NaT would turn into a bogus month, so rows without a date get no month
+            months = df['Date'].values.astype('datetime64[M]').astype(int) % 12 + 1
+            df['Month'] = pd.Series(months, index=df.index).where(df['Date'].notna())
             df['Month_Name'] = df['Date'].dt.month_name()
 
+        # Downcast dtypes to shrink the cached frame
+        for col in ['Temperature(°C)', 'Humidity (%)', 'Barometer (inHg)']:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], downcast='float')
+        for col in ['Weather', 'Wind (mph)', 'Month_Name']:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        if 'Month' in df.columns:
+            # Nullable integer, so rows without a date don't break the cast
+            df['Month'] = df['Month'].astype('UInt8')
+
+        # Save the cleaned sample for the next start
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            df.to_parquet(cache_path, engine="pyarrow", compression="zstd")
+
+            # Remove caches written for older versions of the collection
+            for old_path in glob.glob(os.path.join(CACHE_DIR, "cache_*.parquet")):
+                if os.path.abspath(old_path) != os.path.abspath(cache_path):
+                    os.remove(old_path)
+        except Exception as e:
+            st.warning(f"Could not write data cache: {e}")
+
         return df
 
       except Exception as e:
         st.error(f"Data loading error: {e}")
         return pd.DataFrame()
 
-# Load the data
-df = load_data()
-
-
-# ======== Data Visualizations ========
-if not df.empty:
-
-    # 1. Weather Distribution Pie Chart
-    st.markdown("---")
-    st.header("☁️ Weather Conditions Distribution")
-    weather_counts = df["Weather"].value_counts().sort_values(ascending=False).head()
-    colors = sns.color_palette("pastel").as_hex()
-    plt.figure(figsize=(15, 15))
-
-    fig = px.pie(
-        names=weather_counts.index,
-        values=weather_counts.values,
-        title="Proportion of Weather Conditions",
-        color_discrete_sequence=colors
-    )
-    st.plotly_chart(fig, use_container_width=True)
-
-    # 2. Correlation Heatmap
-    st.markdown("---")
-    st.title("🔍 Features Correlation")
-    st.header("Heatmap to visualize the correlation between the numerical features")
-    features = ["Temperature(°C)", "Humidity (%)", "Barometer (inHg)"]
-    if all(feature in df.columns for feature in features):
-        corr_matrix = df[features].corr()
-        fig, ax = plt.subplots(figsize=(8, 6))
-        sns.heatmap(corr_matrix, annot=True, cmap="coolwarm", fmt=".2f", ax=ax)
-        st.pyplot(fig)
-
-    # 3. Weather Frequency Bar Chart
-    st.markdown("---")
-    st.title("📊 Most Frequent Weather Conditions")
-    st.header("Bar Chart to display the frequency of Weather Conditions")
-    if "Weather" in df.columns:
-        weather_counts = df["Weather"].value_counts().nlargest(10)
-        fig = px.bar(weather_counts,
-                     orientation='h',
-                     color=weather_counts.index,
-                     color_discrete_sequence=px.colors.qualitative.Pastel,
-                     labels={'value': 'Count', 'index': 'Weather Condition'})
-        st.plotly_chart(fig, use_container_width=True)
-
-    # 4. Monthly Temperature Extremes
-    #Line plot
-    st.markdown("---")
-    st.title("🌡️ Monthly Temperature Extremes")
-    st.header("Line plot for comparing the min & max temperature for each month")
-    if 'Month' in df.columns and 'Temperature(°C)' in df.columns:
-        monthly_temp = df.groupby('Month')["Temperature(°C)"].agg(['min', 'max']).reset_index()
-        monthly_temp_melted = monthly_temp.melt(id_vars='Month', value_vars=['min', 'max'],
-                                                var_name='Metric', value_name='Temperature')
-
-        fig = px.line(
-            monthly_temp_melted,
-            x='Month',
-            y='Temperature',
-            color='Metric',
-            markers=True,
-            color_discrete_sequence=['skyblue', 'salmon'],
-            labels={'Temperature': 'Temperature (°C)', 'Month': 'Month'}
-        )
-        st.plotly_chart(fig, use_container_width=True)
-
-    # 5. Temperature Distribution Histogram
-    st.markdown("---")
-    st.header("📈 Temperature Distribution")
-    if 'Temperature(°C)' in df.columns:
-        fig_hist = px.histogram(df, x='Temperature(°C)', nbins=20,
-                                title='Histogram',
-                                color_discrete_sequence=['skyblue'])
-        st.plotly_chart(fig_hist, use_container_width=True)
-
-    # 6.Comparing the temperature distribution for each month using boxplots
-    fig = px.box(df, x='Month', y='Temperature(°C)',
-                 title='Monthly Temperature Variability',
-                 labels={'Month': 'Month', 'Temperature': 'Temperature (°C)'},
-                 points='outliers',
-                 template='plotly_white',
-                 color_discrete_sequence=['#40E0D0'])
-    fig.update_layout()
-    st.plotly_chart(fig, use_container_width=True)
-
-    # 7. Scatter Plot: Temperature vs Humidity
-    st.markdown("---")
-    st.header("💧 Temperature vs Humidity")
-    if 'Temperature(°C)' in df.columns and 'Humidity (%)' in df.columns:
-        fig_scatter1 = px.scatter(
-            df,
-            x='Humidity (%)',
-            y='Temperature(°C)',
-            title='Relationship between Temperature and Humidity',
-            trendline='ols'
-        )
-        st.plotly_chart(fig_scatter1, use_container_width=True)
-
-    # 8. Scatter Plot: Temperature vs Barometer
-    if 'Temperature(°C)' in df.columns and 'Barometer (inHg)' in df.columns:
-        fig_scatter2 = px.scatter(
-            df,
-            x='Barometer (inHg)',
-            y='Temperature(°C)',
-            title='Relationship between Temperature and Barometer',
-            trendline='ols'
-        )
-        st.plotly_chart(fig_scatter2, use_container_width=True)
-
-        # 9.  Stacked barchart to get top 10 most frequent wind types in data with respect to each month
-
-        st.header("Stacked Barchart to get top 10 most frequent wind types in data with respect to each month")
-        # Get top 10 most frequent wind types across the whole dataset
-        top_10_wind_types = df['Wind (mph)'].value_counts().nlargest(10).index
-
-        # Filter the DataFrame to only include top 10 wind types
-        df_top_wind = df[df['Wind (mph)'].isin(top_10_wind_types)]
-
-        # Count wind values by month (pivot table for stacked bar)
-        wind_counts = df_top_wind.pivot_table(index='Month', columns='Wind (mph)', aggfunc='size', fill_value=0)
-
-        # Create plot
-        fig, ax = plt.subplots(figsize=(12, 6))
-        wind_counts.plot(kind='bar', ax=ax, colormap='RdBu', stacked=True)
-
-        # Customize plot
-        ax.set_title('Monthly Wind Conditions (Stacked)')
-        ax.set_xlabel('Month')
-        ax.set_ylabel('Frequency')
-        ax.tick_params(axis='x', rotation=0)
-        plt.tight_layout()
-        ax.legend(title='Wind Type', bbox_to_anchor=(1.05, 1), loc='upper left')
-
-        # Display in Streamlit
-        st.pyplot(fig)
-
-    # 10. Word Cloud for Weather Conditions
-    st.markdown("---")
-    st.header("☁️ Weather Word Cloud")
-    if 'Weather' in df.columns:
-        weather_text = ' '.join(df['Weather'].astype(str))
-        wordcloud = WordCloud(width=800, height=400, background_color='white').generate(weather_text)
-        fig_wc, ax_wc = plt.subplots(figsize=(12, 6))
-        ax_wc.imshow(wordcloud, interpolation='bilinear')
-        ax_wc.axis('off')
-        st.pyplot(fig_wc)
-
-else:
-    st.warning("⚠️ No data available for visualization.")
+# Month of a document's date, as used by the $group stages
+MONTH = {"$month": {"$toDate": "$Date"}}
+
+# Each aggregation is cached on its own and raises on failure, so one failing
+# pipeline neither hides the others nor gets memoised as an empty result.
+@st.cache_data
+def aggregate_weather():
+    """Weather counts, most frequent first"""
+    weather = list(get_collection().aggregate([
+        {"$match": {"Weather": {"$ne": None}}},
+        {"$group": {"_id": "$Weather", "n": {"$sum": 1}}},
+        {"$sort": {"n": -1}},
+    ]))
+    if not weather:
+        return {}
+    weather_counts = pd.Series([doc["n"] for doc in weather],
+                               index=pd.Index([doc["_id"] for doc in weather], name="Weather"),
+                               name="count")
+    return {
+        'weather_top5': weather_counts.head(),
+        'weather_top10': weather_counts.head(10),
+        'weather_freqs': {str(k): int(v) for k, v in weather_counts.items()},
+    }
+
+@st.cache_data
+def aggregate_monthly_temp():
+    """Min & max temperature for each month"""
+    monthly = list(get_collection().aggregate([
+        {"$match": {"Date": {"$ne": None}}},
+        {"$group": {"_id": MONTH,
+                    "min": {"$min": "$Temperature(°C)"},
+                    "max": {"$max": "$Temperature(°C)"}}},
+        {"$sort": {"_id": 1}},
+    ]))
+    if not monthly:
+        return {}
+    return {'monthly_temp': pd.DataFrame({
+        'Month': [doc["_id"] for doc in monthly],
+        'min': [doc["min"] for doc in monthly],
+        'max': [doc["max"] for doc in monthly],
+    })}
+
+@st.cache_data
+def aggregate_wind():
+    """Counts of the top 10 wind types for each month"""
+    wind = list(get_collection().aggregate([
+        {"$match": {"Date": {"$ne": None}, "Wind (mph)": {"$ne": None}}},
+        {"$group": {"_id": {"month": MONTH, "wind": "$Wind (mph)"}, "n": {"$sum": 1}}},
+    ]))
+    if not wind:
+        return {}
+    wind_counts = pd.DataFrame({
+        'Month': [doc["_id"]["month"] for doc in wind],
+        'Wind (mph)': [doc["_id"]["wind"] for doc in wind],
+        'n': [doc["n"] for doc in wind],
+    })
+    # Get top 10 most frequent wind types across the whole dataset
+    top_10_wind_types = wind_counts.groupby('Wind (mph)')['n'].sum().nlargest(10).index
+
+    # Count wind values by month (one column per wind type for stacked bar)
+    return {'wind_pivot': (wind_counts[wind_counts['Wind (mph)'].isin(top_10_wind_types)]
+                           .pivot(index='Month', columns='Wind (mph)', values='n')
+                           .reindex(columns=top_10_wind_types)
+                           .fillna(0).astype(int)
+                           .sort_index())}
+
+@st.cache_data
+def aggregate_correlation():
+    """Correlation between the numerical features, from sums and cross products"""
+    group = {"_id": None, "n": {"$sum": 1}}
+    for i, a in enumerate(CORR_FEATURES):
+        group[f"s{i}"] = {"$sum": f"${a}"}
+        for j, b in enumerate(CORR_FEATURES[i:], start=i):
+            group[f"p{i}{j}"] = {"$sum": {"$multiply": [f"${a}", f"${b}"]}}
+    sums = list(get_collection().aggregate([
+        {"$match": {field: {"$type": "number"} for field in CORR_FEATURES}},
+        {"$group": group},
+    ]))
+    if not sums or sums[0]["n"] < 2:
+        return {}
+    doc, k = sums[0], len(CORR_FEATURES)
+    s = np.array([doc[f"s{i}"] for i in range(k)], dtype=float)
+    p = np.array([[doc[f"p{min(i, j)}{max(i, j)}"] for j in range(k)] for i in range(k)], dtype=float)
+    cov = p / doc["n"] - np.outer(s, s) / doc["n"] ** 2
+    std = np.sqrt(np.diag(cov))
+    return {'corr_matrix': pd.DataFrame(cov / np.outer(std, std), index=CORR_FEATURES, columns=CORR_FEATURES)}
+
+def load_aggregates():
+    """Run the count/min/max aggregations inside MongoDB and return whatever succeeded"""
+    aggregates = {}
+    for aggregate in [aggregate_weather, aggregate_monthly_temp, aggregate_wind, aggregate_correlation]:
+        try:
+            aggregates.update(aggregate())
+        except Exception as e:
+            st.error(f"Aggregation error: {e}")
+    return aggregates
+
+# ======== Run the dashboard ========
+run(load_raw_sample, load_aggregates)